@@ -431,7 +431,7 @@ class NLPModel(ModelPT, Exportable):
             cls._set_model_restore_state(is_being_restored=False)
         return checkpoint
 
-    def load_state_dict(self, state_dict: Mapping[str, Any], strict: bool = True):
+    def load_state_dict(self, state_dict: Mapping[str, Any], strict: bool = True, assign: bool = False):
         # starting with trasformers v4.31.0, buffer for position_ids is persistent=False
         if (
             self.bert_model is not None
@@ -444,7 +444,9 @@ class NLPModel(ModelPT, Exportable):
             pos_id_keys = [x for x in state_dict.keys() if "position_ids" in x]
             for key in pos_id_keys:
                 del state_dict[key]
-        results = super(NLPModel, self).load_state_dict(state_dict, strict=strict)
+        # `assign` only exists from torch 2.1 on, so only pass it when requested to keep older versions working.
+        kwargs = {'assign': True} if assign else {}
+        results = super(NLPModel, self).load_state_dict(state_dict, strict=strict, **kwargs)
         return results
 
     @classmethod
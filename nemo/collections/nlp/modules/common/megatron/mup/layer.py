@@ -37,6 +37,8 @@
 # Most of the code here has been copied from:
 # https://github.com/microsoft/mup
 
+import math
+
 import torch
 
 from nemo.collections.nlp.modules.common.megatron.module import MegatronModule
@@ -74,6 +76,10 @@ class MuReadout(MegatronModule):
         self.bias.stride = 1
         self.parallel_output = parallel_output
         self.warn_once = False
+        # Tensor model parallel size is fixed once the model is built, so avoid querying it on every forward.
+        self.async_tensor_model_parallel_allreduce = (
+            parallel_state.get_tensor_model_parallel_world_size() > 1 if HAVE_MEGATRON_CORE else False
+        )
 
     def forward(self, hidden_states, word_embeddings_weight):
         if hasattr(word_embeddings_weight, 'infshape'):
@@ -83,13 +89,15 @@ class MuReadout(MegatronModule):
             if not self.warn_once:
                 logging.warning("need to set_shape before use mu-Transfer readout layer")
             self.warn_once = True
-        async_tensor_model_parallel_allreduce = parallel_state.get_tensor_model_parallel_world_size() > 1
+        # Skip the elementwise scaling when it is a no-op, so we don't materialize a copy of hidden_states.
+        if width_mult != 1.0:
+            hidden_states = hidden_states / width_mult
         output = parallel_lm_logits(
-            hidden_states / width_mult,
+            hidden_states,
             word_embeddings_weight,
             self.parallel_output,
             bias=self.bias,
-            async_tensor_model_parallel_allreduce=async_tensor_model_parallel_allreduce,
+            async_tensor_model_parallel_allreduce=self.async_tensor_model_parallel_allreduce,
         )
         return output
 
@@ -109,5 +117,5 @@ def rescale_linear_bias(linear):
     if linear.bias is None:
         return
     fanin_mult = linear.weight.infshape[1].width_mult()
-    linear.bias.data *= fanin_mult ** 0.5
+    linear.bias.data.mul_(math.sqrt(fanin_mult))
     linear._has_rescaled_params = True
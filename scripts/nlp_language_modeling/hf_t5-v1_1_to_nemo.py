@@ -44,260 +44,211 @@ Use instructions:
 
 python hf_t5-v1_1_to_nemo.py \
     --hf_model_name bigscience/T0pp \
-    --nemo_state_dict /path/to/nemo_state_dict.pt \
     --nemo_file_path /path/to/nemo_file.nemo
+
+The converted state dict is handed to the packaging step in memory. Pass
+`--nemo_state_dict_path /path/to/nemo_state_dict.safetensors` to also keep a copy of it on disk. Paths ending in
+`.safetensors` are written with safetensors, any other path with `torch.save`.
 """
 import collections
+import gc
 import os
+import re
 import tempfile
 from argparse import ArgumentParser
 
 import torch
-from omegaconf.omegaconf import OmegaConf, open_dict
-from pytorch_lightning import Trainer
 from transformers import AutoTokenizer, T5ForConditionalGeneration
 
-from nemo.collections.nlp.models.language_modeling.megatron_t5_model import MegatronT5Model
-from nemo.collections.nlp.parts.nlp_overrides import NLPDDPStrategy, NLPSaveRestoreConnector
-
 try:
     import accelerate
 except ImportError:
     raise ImportError("Please install accelerate package via `pip install accelerate` to use this script.")
 
 
-def convert_weights(hf_model, nemo_state_dict_path):
-    if hf_model == 'google/ul2':
-        torch_dtype = torch.bfloat16
-    else:
-        torch_dtype = torch.float32
-    hf_model = T5ForConditionalGeneration.from_pretrained(hf_model, low_cpu_mem_usage=True, torch_dtype=torch_dtype)
-    hf_model_config = hf_model.config
-    with tempfile.TemporaryDirectory() as tmp:
-        torch.save(hf_model.state_dict(), os.path.join(tmp, 'model.pt'))
-        hf_weights = torch.load(os.path.join(tmp, 'model.pt'))
+# HF keys that map directly onto a single NeMo key.
+# `shared.weight` is tied to the encoder and decoder embeddings, so it is not mapped separately.
+_HF_TO_NEMO_KEYS = {
+    'lm_head.weight': 'enc_dec_model.tokens_head.weight',
+    'encoder.embed_tokens.weight': 'enc_dec_model.encoder_embedding.word_embeddings.weight',
+    'decoder.embed_tokens.weight': 'enc_dec_model.decoder_embedding.word_embeddings.weight',
+    'encoder.block.0.layer.0.SelfAttention.relative_attention_bias.weight': 'enc_dec_model.encoder_relative_position_embedding.relative_position_embedding.weight',
+    'decoder.block.0.layer.0.SelfAttention.relative_attention_bias.weight': 'enc_dec_model.decoder_relative_position_embedding.relative_position_embedding.weight',
+    'encoder.final_layer_norm.weight': 'enc_dec_model.enc_dec_model.encoder.model.final_layernorm.weight',
+    'decoder.final_layer_norm.weight': 'enc_dec_model.enc_dec_model.decoder.model.final_layernorm.weight',
+}
+
+# Block in HF corresponds to layer in NeMo.
+# Layer in HF does not correspond to anything in NeMo. Layer 0 is self attn, layer 1 is cross-attn.
+_HF_BLOCK_KEY_PATTERN = re.compile(
+    r'^(?P<model_type>encoder|decoder)\.block\.(?P<block>\d+)\.layer\.(?P<layer>\d+)\.(?P<name>.+)$'
+)
+
+# Per-block HF parameters that map one-to-one onto a parameter of the corresponding NeMo layer.
+_HF_TO_NEMO_LAYER_KEYS = {
+    'SelfAttention.o.weight': 'self_attention.dense.weight',
+    'EncDecAttention.q.weight': 'inter_attention.query.weight',
+    'EncDecAttention.o.weight': 'inter_attention.dense.weight',
+    'DenseReluDense.wi_0.weight': 'mlp.dense_h_to_4h.weight',
+    'DenseReluDense.wi_1.weight': 'mlp.dense_h_to_4h_2.weight',
+    'DenseReluDense.wo.weight': 'mlp.dense_4h_to_h.weight',
+}
+
+# NeMo layernorm names keyed on (model type, HF layer number) for the per-block `layer_norm.weight` parameters.
+_LN_MAP = {
+    ('encoder', 0): 'input_layernorm',
+    ('encoder', 1): 'post_attention_layernorm',
+    ('decoder', 0): 'input_layernorm',
+    ('decoder', 1): 'post_attention_layernorm',
+    ('decoder', 2): 'post_inter_attention_layernorm',
+}
+
+
+def _concat_and_release(tensors):
+    """
+    Concatenates `tensors` along dim 0 into a preallocated buffer, dropping each source from the list
+    as soon as it has been copied so that the sources are freed progressively instead of all at the end.
+    """
+    fused = torch.empty((sum(t.shape[0] for t in tensors), *tensors[0].shape[1:]), dtype=tensors[0].dtype)
+    offset = 0
+    while tensors:
+        t = tensors.pop(0)
+        fused[offset : offset + t.shape[0]].copy_(t)
+        offset += t.shape[0]
+    return fused
 
-    nemo_weights = collections.OrderedDict()
 
-    print(f'Found {len(hf_weights.keys())} keys in the checkpoint')
+def _clone_shared_storages(state_dict):
+    """
+    Clones tensors that share their storage with another entry of `state_dict` (ex: the tied HF encoder and decoder
+    embeddings) or that only view part of a larger storage, so that every tensor owns exactly its own data as
+    safetensors requires.
+    """
+    seen_storages = set()
+    for key, tensor in state_dict.items():
+        storage = tensor.untyped_storage()
+        if storage.data_ptr() in seen_storages or storage.nbytes() != tensor.numel() * tensor.element_size():
+            tensor = tensor.detach().clone(memory_format=torch.contiguous_format)
+            state_dict[key] = tensor
+        seen_storages.add(tensor.untyped_storage().data_ptr())
 
-    def _get_model_type_block_layer(k):
-        if k.startswith('encoder'):
-            model_type = 'encoder'
-        elif k.startswith('decoder'):
-            model_type = 'decoder'
-        else:
-            raise ValueError(f"Unknown model type for {k}")
 
-        return model_type, int(k.split('.')[2]), int(k.split('.')[4])
+def _build_key_map(hf_keys):
+    """
+    Maps every NeMo key to the tuple of HF keys it is built from. Fused matrices (self-attention QKV and
+    cross-attention KV) are built from several HF keys that are concatenated along dim 0, in the listed order.
+    """
+    key_map = collections.OrderedDict()
 
-    for k, v in hf_weights.items():
-        #################################################
-        ###### Enc-Dec Embeddings and Output Layer ######
-        #################################################
-        # Tied decoder embedding and decoder output layer.
+    for k in hf_keys:
+        # Tied with the encoder and decoder embeddings.
         if k == 'shared.weight':
-            pass
-
-        elif k == 'lm_head.weight':
-            nemo_weights['enc_dec_model.tokens_head.weight'] = v
-            print(
-                f'Mapped {k} to enc_dec_model.decoder_embedding.word_embeddings.weight and enc_dec_model.tokens_head.weight'
-            )
+            continue
 
-        # Decoder embeddings
-        elif k == 'decoder.embed_tokens.weight':
-            nemo_weights['enc_dec_model.decoder_embedding.word_embeddings.weight'] = v
+        if k in _HF_TO_NEMO_KEYS:
+            key_map[_HF_TO_NEMO_KEYS[k]] = (k,)
+            continue
 
-        elif k == 'encoder.embed_tokens.weight':
-            nemo_weights['enc_dec_model.encoder_embedding.word_embeddings.weight'] = v
-            print(f'Mapped {k} to enc_dec_model.encoder_embedding.word_embeddings.weight')
-
-        #################################################
-        ################# RPE Weights ###################
-        #################################################
-
-        elif k == 'encoder.block.0.layer.0.SelfAttention.relative_attention_bias.weight':
-            nemo_weights['enc_dec_model.encoder_relative_position_embedding.relative_position_embedding.weight'] = v
-            print(
-                f'Mapped {k} to enc_dec_model.encoder_relative_position_embedding.relative_position_embedding.weight'
+        match = _HF_BLOCK_KEY_PATTERN.match(k)
+        if match is None:
+            raise ValueError(f"Unknown key: {k}")
+        model_type, block_number, layer_number, name = match.group('model_type', 'block', 'layer', 'name')
+        nemo_layer_prefix = f'enc_dec_model.enc_dec_model.{model_type}.model.layers.{block_number}'
+
+        if name in _HF_TO_NEMO_LAYER_KEYS:
+            key_map[f'{nemo_layer_prefix}.{_HF_TO_NEMO_LAYER_KEYS[name]}'] = (k,)
+
+        # Q, K, V in NeMo-Megatron is bundled into a single matrix.
+        elif name == 'SelfAttention.q.weight':
+            key_map[f'{nemo_layer_prefix}.self_attention.query_key_value.weight'] = (
+                k,
+                k.replace('q.weight', 'k.weight'),
+                k.replace('q.weight', 'v.weight'),
             )
 
-        elif k == 'decoder.block.0.layer.0.SelfAttention.relative_attention_bias.weight':
-            nemo_weights['enc_dec_model.decoder_relative_position_embedding.relative_position_embedding.weight'] = v
-            print(
-                f'Mapped {k} to enc_dec_model.decoder_relative_position_embedding.relative_position_embedding.weight'
-            )
+        # Cross-Attention projection matrices are merged into K, V matrices in NeMo-Megatron
+        elif name == 'EncDecAttention.k.weight':
+            key_map[f'{nemo_layer_prefix}.inter_attention.key_value.weight'] = (k, k.replace('k.weight', 'v.weight'))
 
-        # Block in HF corresponds to layer in NeMo.
-        # Layer in HF does not correspond to anything in NeMo. Layer 0 is self attn, layer 1 is cross-attn.
-
-        #################################################
-        ############### Attention Layers ################
-        #################################################
-
-        # Self-Attention
-
-        # Q, k, V in NeMo-Megatron is bundled into a single matrix.
-        elif 'SelfAttention.q.weight' in k:
-            model_type, block_number, layer_number = _get_model_type_block_layer(k)
-            k_weight = hf_weights[k.replace('q.weight', 'k.weight')]
-            v_weight = hf_weights[k.replace('q.weight', 'v.weight')]
-            concat_weights = torch.cat([v, k_weight, v_weight], dim=0)
-            nemo_weights[
-                f'enc_dec_model.enc_dec_model.{model_type}.model.layers.{block_number}.self_attention.query_key_value.weight'
-            ] = concat_weights
-            print(
-                f'Mapped {k} to enc_dec_model.enc_dec_model.{model_type}.model.layers.{block_number}.self_attention.query_key_value.weight'
-            )
+        # We can skip processing of k, v weights since they are fused with the q (or cross-attention k) weight above.
+        elif name in ('SelfAttention.k.weight', 'SelfAttention.v.weight', 'EncDecAttention.v.weight'):
+            continue
 
-        # We can skip processing of k, v weights since we already concat them into qkv above.
-        elif 'SelfAttention.k.weight' in k or 'SelfAttention.v.weight' in k:
-            pass
-
-        # Output self-attn matrix.
-        elif 'SelfAttention.o.weight' in k:
-            model_type, block_number, layer_number = _get_model_type_block_layer(k)
-            block_number = int(k.split('.')[2])  # Block in HF corresponds to layer in NeMo.
-            layer_number = int(
-                k.split('.')[4]
-            )  # Layer in HF does not correspond to anything in NeMo. Layer 0 is self attn, layer 1 is cross-attn.
-            nemo_weights[
-                f'enc_dec_model.enc_dec_model.{model_type}.model.layers.{block_number}.self_attention.dense.weight'
-            ] = v
-            print(
-                f'Mapped {k} to enc_dec_model.enc_dec_model.{model_type}.model.layers.{block_number}.self_attention.dense.weight'
-            )
+        elif name == 'layer_norm.weight':
+            try:
+                layernorm_name = _LN_MAP[(model_type, int(layer_number))]
+            except KeyError:
+                raise ValueError("Unknown layer_norm key: {}".format(k))
+            key_map[f'{nemo_layer_prefix}.{layernorm_name}.weight'] = (k,)
 
-        # Cross-Attention projection matrices are merged into K, V matrices in NeMo-Megatron
-        elif 'EncDecAttention.k.weight' in k:
-            model_type, block_number, layer_number = _get_model_type_block_layer(k)
-            v_weight = hf_weights[k.replace('k.weight', 'v.weight')]
-            concat_weights = torch.cat([v, v_weight], dim=0)
-            nemo_weights[
-                f'enc_dec_model.enc_dec_model.decoder.model.layers.{block_number}.inter_attention.key_value.weight'
-            ] = concat_weights
-            print(
-                f'Mapped {k} to enc_dec_model.enc_dec_model.decoder.model.layers.{block_number}.inter_attention.key_value.weight'
-            )
+        else:
+            raise ValueError(f"Unknown key: {k}")
 
-        # We can skip processing of v weights since we already concat them with k above.
-        elif 'EncDecAttention.v.weight' in k:
-            pass
-
-        # Cross-Attention Q matrix is separate in NeMo-Megatron
-        elif 'EncDecAttention.q.weight' in k:
-            model_type, block_number, layer_number = _get_model_type_block_layer(k)
-            nemo_weights[
-                f'enc_dec_model.enc_dec_model.decoder.model.layers.{block_number}.inter_attention.query.weight'
-            ] = v
-            print(
-                f'Mapped {k} to enc_dec_model.enc_dec_model.decoder.model.layers.{block_number}.inter_attention.query.weight'
-            )
+    return key_map
 
-        # Cross-Attention Q matrix is separate in NeMo-Megatron
-        elif 'EncDecAttention.o.weight' in k:
-            model_type, block_number, layer_number = _get_model_type_block_layer(k)
-            nemo_weights[
-                f'enc_dec_model.enc_dec_model.decoder.model.layers.{block_number}.inter_attention.dense.weight'
-            ] = v
-            print(
-                f'Mapped {k} to enc_dec_model.enc_dec_model.decoder.model.layers.{block_number}.inter_attention.dense.weight'
-            )
 
-        #################################################
-        #################$ FFN Layers ###################
-        #################################################
-
-        elif 'DenseReluDense.wi_0.weight' in k:
-            model_type, block_number, layer_number = _get_model_type_block_layer(k)
-            nemo_weights[
-                f'enc_dec_model.enc_dec_model.{model_type}.model.layers.{block_number}.mlp.dense_h_to_4h.weight'
-            ] = v
-            print(
-                f'Mapped {k} to enc_dec_model.enc_dec_model.{model_type}.model.layers.{block_number}.mlp.dense_h_to_4h.weight'
-            )
+def convert_weights(hf_model, nemo_state_dict_path=None, verbose=False):
+    log = print if verbose else lambda *args, **kwargs: None
 
-        elif 'DenseReluDense.wi_1.weight' in k:
-            model_type, block_number, layer_number = _get_model_type_block_layer(k)
-            nemo_weights[
-                f'enc_dec_model.enc_dec_model.{model_type}.model.layers.{block_number}.mlp.dense_h_to_4h_2.weight'
-            ] = v
-            print(
-                f'Mapped {k} to enc_dec_model.enc_dec_model.{model_type}.model.layers.{block_number}.mlp.dense_h_to_4h_2.weight'
-            )
+    # Keep the weights in the precision they were stored in (ex: bf16 for google/ul2) instead of upcasting to fp32.
+    # package_into_nemo_file casts them to the NeMo model's parameter dtypes before loading them.
+    hf_model = T5ForConditionalGeneration.from_pretrained(hf_model, low_cpu_mem_usage=True, torch_dtype='auto')
+    hf_model_config = hf_model.config
+    # The state dict tensors keep the parameter storages alive, so the module wrappers can be dropped right away.
+    # Collect explicitly since reference cycles in the module tree (ex: hooks attached while loading) would otherwise
+    # keep the HF model alive until the next automatic collection.
+    hf_weights = hf_model.state_dict()
+    del hf_model
+    gc.collect()
 
-        elif 'DenseReluDense.wo.weight' in k:
-            model_type, block_number, layer_number = _get_model_type_block_layer(k)
-            nemo_weights[
-                f'enc_dec_model.enc_dec_model.{model_type}.model.layers.{block_number}.mlp.dense_4h_to_h.weight'
-            ] = v
-            print(
-                f'Mapped {k} to enc_dec_model.enc_dec_model.{model_type}.model.layers.{block_number}.mlp.dense_4h_to_h.weight'
-            )
+    print(f'Found {len(hf_weights)} keys in the checkpoint')
 
-        #################################################
-        #################$ LayerNorm ####################
-        #################################################
-
-        elif 'layer_norm' in k:
-            if 'final' in k:
-                model_type = 'encoder' if k.startswith('encoder') else 'decoder'
-                nemo_weights[f'enc_dec_model.enc_dec_model.{model_type}.model.final_layernorm.weight'] = v
-                print(f'Mapped {k} to enc_dec_model.enc_dec_model.{model_type}.model.final_layernorm.weight')
-            else:
-                model_type, block_number, layer_number = _get_model_type_block_layer(k)
-                if layer_number == 0 and model_type == 'encoder':
-                    nemo_weights[
-                        f'enc_dec_model.enc_dec_model.{model_type}.model.layers.{block_number}.input_layernorm.weight'
-                    ] = v
-                    print(
-                        f'Mapped {k} to enc_dec_model.enc_dec_model.{model_type}.model.layers.{block_number}.input_layernorm.weight'
-                    )
-                elif layer_number == 1 and model_type == 'encoder':
-                    nemo_weights[
-                        f'enc_dec_model.enc_dec_model.{model_type}.model.layers.{block_number}.post_attention_layernorm.weight'
-                    ] = v
-                    print(
-                        f'Mapped {k} to enc_dec_model.enc_dec_model.{model_type}.model.layers.{block_number}.post_attention_layernorm.weight'
-                    )
-                elif layer_number == 0 and model_type == 'decoder':
-                    nemo_weights[
-                        f'enc_dec_model.enc_dec_model.{model_type}.model.layers.{block_number}.input_layernorm.weight'
-                    ] = v
-                    print(
-                        f'Mapped {k} to enc_dec_model.enc_dec_model.{model_type}.model.layers.{block_number}.input_layernorm.weight'
-                    )
-                elif layer_number == 1 and model_type == 'decoder':
-                    nemo_weights[
-                        f'enc_dec_model.enc_dec_model.{model_type}.model.layers.{block_number}.post_attention_layernorm.weight'
-                    ] = v
-                    print(
-                        f'Mapped {k} to enc_dec_model.enc_dec_model.{model_type}.model.layers.{block_number}.post_attention_layernorm.weight'
-                    )
-                elif layer_number == 2 and model_type == 'decoder':
-                    nemo_weights[
-                        f'enc_dec_model.enc_dec_model.{model_type}.model.layers.{block_number}.post_inter_attention_layernorm.weight'
-                    ] = v
-                    print(
-                        f'Mapped {k} to enc_dec_model.enc_dec_model.{model_type}.model.layers.{block_number}.post_inter_attention_layernorm.weight'
-                    )
-                else:
-                    raise ValueError("Unknown layer_norm key: {}".format(k))
-        else:
-            raise ValueError(f"Unknown key: {k}")
+    key_map = _build_key_map(hf_weights.keys())
 
-    torch.save(nemo_weights, nemo_state_dict_path)
-    print("Saved weights to {}".format(nemo_state_dict_path))
-    return hf_model_config
+    # Renamed weights are used as is, fused matrices are concatenated. Every HF tensor is popped as it is consumed
+    # so that it is released as soon as it has been mapped.
+    nemo_weights = collections.OrderedDict()
+    for nemo_key, hf_keys in key_map.items():
+        tensors = [hf_weights.pop(k) for k in hf_keys]
+        nemo_weights[nemo_key] = tensors[0] if len(tensors) == 1 else _concat_and_release(tensors)
+        del tensors
+        log(f'Mapped {", ".join(hf_keys)} to {nemo_key}')
+
+    hf_weights.pop('shared.weight', None)
+    if hf_weights:
+        raise ValueError(f"Unused keys: {list(hf_weights.keys())}")
+
+    if nemo_state_dict_path is not None:
+        if nemo_state_dict_path.endswith('.safetensors'):
+            # Writes the raw tensor bytes directly instead of pickling every tensor.
+            from safetensors.torch import save_file
+
+            # Only needed on disk: the NeMo model shares a single embedding module between the encoder and decoder,
+            # so the aliased tensors can be handed to packaging as they are. `torch.save` dedups shared storages.
+            _clone_shared_storages(nemo_weights)
+            save_file(nemo_weights, nemo_state_dict_path)
+        else:
+            torch.save(nemo_weights, nemo_state_dict_path)
+        print("Saved weights to {}".format(nemo_state_dict_path))
+    return hf_model_config, nemo_weights
 
 
 def package_into_nemo_file(
-    state_dict_path, base_yaml_config, hf_model_config, nemo_file_path, hf_model_name, megatron_amp_O2
+    state_dict, base_yaml_config, hf_model_config, nemo_file_path, hf_model_name, megatron_amp_O2
 ):
     """
     Packages the state dict, config file and tokenizer into a `.nemo` file.
+
+    `state_dict` is renamed and cast in place, so that each original tensor is released as soon as it is replaced.
     """
+    # Imported here rather than at the top of the file, since pulling in the NeMo and Lightning stack takes seconds
+    # and is not needed for argument parsing or weight conversion.
+    from omegaconf.omegaconf import OmegaConf, open_dict
+    from pytorch_lightning import Trainer
+
+    from nemo.collections.nlp.models.language_modeling.megatron_t5_model import MegatronT5Model
+    from nemo.collections.nlp.parts.nlp_overrides import NLPDDPStrategy, NLPSaveRestoreConnector
+
     trainer = Trainer(devices=1, strategy=NLPDDPStrategy(), accelerator="cpu", precision=32)
     base_cfg = OmegaConf.load(base_yaml_config)
     if hf_model_config.dense_act_fn == "silu":
@@ -333,17 +284,39 @@ def package_into_nemo_file(
         tokenizer = AutoTokenizer.from_pretrained(hf_model_name)
         tokenizer_path = tokenizer.save_vocabulary(tmp)[0]
         base_cfg.tokenizer.model = tokenizer_path
-        model = MegatronT5Model(base_cfg, trainer).to('cpu')
+        if megatron_amp_O2:
+            # megatron_amp_O2 moves the model to GPU while building it, which meta tensors can't do.
+            model = MegatronT5Model(base_cfg, trainer).to('cpu')
+        else:
+            # All parameters are replaced by the converted tensors, so build the model on the meta device instead of
+            # allocating and randomly initializing weights that would only be thrown away. Weights are only created
+            # without an explicit CUDA device with CPU initialization, so force it while building and restore the
+            # configured value afterwards so it doesn't end up in the packaged config.
+            use_cpu_initialization = base_cfg.get('use_cpu_initialization', False)
+            with open_dict(base_cfg):
+                base_cfg.use_cpu_initialization = True
+            with torch.device('meta'):
+                model = MegatronT5Model(base_cfg, trainer)
+            with open_dict(model.cfg):
+                model.cfg.use_cpu_initialization = use_cpu_initialization
         model._save_restore_connector = NLPSaveRestoreConnector()
-        state_dict = torch.load(state_dict_path)
         if megatron_amp_O2:
-            new_state_dict = {}
-            for key in state_dict.keys():
-                new_key = key.replace('model.', 'model.module.', 1)
-                new_state_dict[new_key] = state_dict[key]
-            state_dict = new_state_dict
-        model.load_state_dict(state_dict)
-        model.save_to(nemo_file_path)
+            for key in list(state_dict.keys()):
+                state_dict[key.replace('model.', 'model.module.', 1)] = state_dict.pop(key)
+        # `assign=True` makes the converted tensors the model parameters instead of copying them into the existing
+        # ones, so they have to be cast to the parameter dtypes up front (a no-op when they already match).
+        # Loading strictly guarantees that no parameter is left on the meta device. Megatron linear layers also report
+        # a `None` `_extra_state` entry, which has no dtype to cast to.
+        param_dtypes = {
+            key: value.dtype for key, value in model.state_dict().items() if isinstance(value, torch.Tensor)
+        }
+        # Casting, loading and saving only move weights around, so skip autograd tracking for them.
+        with torch.inference_mode():
+            for key, value in state_dict.items():
+                if key in param_dtypes:
+                    state_dict[key] = value.to(param_dtypes[key])
+            model.load_state_dict(state_dict, assign=True)
+            model.save_to(nemo_file_path)
 
 
 if __name__ == '__main__':
@@ -357,8 +330,8 @@ if __name__ == '__main__':
     parser.add_argument(
         "--nemo_state_dict_path",
         type=str,
-        required=True,
-        help="Path to write the intermediate nemo state dict file ex: /path/to/nemo_state_dict.pt",
+        default=None,
+        help="Optional path to also write the intermediate nemo state dict file ex: /path/to/nemo_state_dict.safetensors",
     )
     parser.add_argument(
         "--nemo_file_path",
@@ -377,12 +350,17 @@ if __name__ == '__main__':
         action="store_true",
         help="Whether to store O2 weights. This may be useful for models like ul2 where only pre-trained half precision weights were released.",
     )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Print how every HF key is mapped to a NeMo key.",
+    )
     args = parser.parse_args()
     if not os.path.exists(args.base_yaml_config):
         raise FileNotFoundError(f"Base yaml config file {args.base_yaml_config} does not exist.")
-    hf_model_config = convert_weights(args.hf_model_name, args.nemo_state_dict_path)
+    hf_model_config, nemo_weights = convert_weights(
+        args.hf_model_name, args.nemo_state_dict_path, verbose=args.verbose
+    )
     package_into_nemo_file(
-        state_dict_path=args.nemo_state_dict_path,
+        state_dict=nemo_weights,
         base_yaml_config=args.base_yaml_config,
         hf_model_config=hf_model_config,
         nemo_file_path=args.nemo_file_path,